@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import re
 from typing import Any
 
 import tiktoken
@@ -57,9 +59,11 @@ $globals
 """
 
 
+_MODEL_IDENTIFIER_PATTERN = re.compile(r"[^:]+:[^:]+")
+
+
 def _validate_model_identifier(model: str) -> str:
-    parts = model.split(":")
-    if len(parts) != 2 or not parts[0] or not parts[1]:
+    if _MODEL_IDENTIFIER_PATTERN.fullmatch(model) is None:
         raise ValueError(f"Invalid model identifier {model!r}; expected 'provider:model'")
     return model
 
@@ -157,12 +161,19 @@ class StepExecutorConfiguration(BaseModel):
         otherwise infers from the model name.  Falls back to o200k_base if the
         model name is not recognized by tiktoken.
         """
-        if self.tokenizer_encoding is not None:
-            return tiktoken.get_encoding(self.tokenizer_encoding)
+        return _resolve_token_encoding(model=self.model, tokenizer_encoding=self.tokenizer_encoding)
+
+
+# Prompts are built once per step; cache the lookup so the model identifier is split and
+# matched against tiktoken's model table only once per (model, encoding) pair.
+@functools.lru_cache(maxsize=256)
+def _resolve_token_encoding(*, model: str, tokenizer_encoding: str | None) -> tiktoken.Encoding:
+    if tokenizer_encoding is not None:
+        return tiktoken.get_encoding(tokenizer_encoding)
 
-        _, model_name = self.model.split(":", 1)
+    _, model_name = model.split(":", 1)
 
-        try:
-            return tiktoken.encoding_for_model(model_name)
-        except Exception:
-            return tiktoken.get_encoding("o200k_base")
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except Exception:
+        return tiktoken.get_encoding("o200k_base")
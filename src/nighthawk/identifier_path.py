@@ -7,6 +7,10 @@ where no segment starts with ``__`` (dunder).  Examples: ``result``,
 
 from __future__ import annotations
 
+import re
+
+_IDENTIFIER_PATH_PATTERN = re.compile(r"(?!__)[A-Za-z_][A-Za-z0-9_]*(?:\.(?!__)[A-Za-z_][A-Za-z0-9_]*)*")
+
 
 def parse_identifier_path(path: str) -> tuple[str, ...] | None:
     """Parse a dot-separated identifier path.
@@ -15,21 +19,7 @@ def parse_identifier_path(path: str) -> tuple[str, ...] | None:
     empty, contains empty segments, non-ASCII characters, non-identifier
     segments, or dunder-prefixed segments.
     """
-    if not path:
-        return None
-
-    parts = path.split(".")
-    if any(part == "" for part in parts):
+    if _IDENTIFIER_PATH_PATTERN.fullmatch(path) is None:
         return None
 
-    for part in parts:
-        try:
-            part.encode("ascii")
-        except UnicodeEncodeError:
-            return None
-        if not part.isidentifier():
-            return None
-        if part.startswith("__"):
-            return None
-
-    return tuple(parts)
+    return tuple(path.split("."))
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import ast
+import functools
 import inspect
 import logging
 import sys
 import textwrap
 from collections.abc import Awaitable, Callable
 from functools import wraps
+from types import CodeType
 from typing import Any, cast
 
 from ..runtime.runner import Runner, StepEnvelope
@@ -108,8 +110,9 @@ def _extract_inline_fstring_name_set(function_source: str, *, function_name: str
     return names
 
 
-def _build_capture_name_set(source: str, function_name: str) -> set[str]:
-    """Build the set of names that need to be captured from the enclosing scope."""
+@functools.lru_cache(maxsize=256)
+def _build_capture_name_tuple(source: str, function_name: str) -> tuple[str, ...]:
+    """Build the sorted names that need to be captured from the enclosing scope."""
     capture_name_set: set[str] = set()
     try:
         for block in find_natural_blocks(source):
@@ -119,14 +122,14 @@ def _build_capture_name_set(source: str, function_name: str) -> set[str]:
     except Exception as exception:
         logging.getLogger("nighthawk").warning("Failed to extract capture names for %s: %s", function_name, exception)
         capture_name_set = set()
-    return capture_name_set
+    return tuple(sorted(capture_name_set))
 
 
 def _build_transformed_factory_module(
     *,
     transformed_module: ast.Module,
     function_name: str,
-    name_to_value: dict[str, object],
+    captured_value_name_tuple: tuple[str, ...],
 ) -> ast.Module:
     """Build a factory-function module that captures enclosing-scope values via closure."""
     transformed_function_def: ast.FunctionDef | ast.AsyncFunctionDef | None = None
@@ -142,7 +145,7 @@ def _build_transformed_factory_module(
     factory_name = "__nh_factory__"
 
     factory_body: list[ast.stmt] = []
-    for name in sorted(name_to_value.keys()):
+    for name in captured_value_name_tuple:
         factory_body.append(
             ast.Assign(
                 targets=[ast.Name(id=name, ctx=ast.Store())],
@@ -177,6 +180,40 @@ def _build_transformed_factory_module(
     return factory_module
 
 
+# Natural functions defined inside another function are decorated again on every call of
+# the enclosing function. Everything up to the compiled factory depends only on the source
+# text and the captured names, so it is cached on those; captured values are bound per call.
+@functools.lru_cache(maxsize=256)
+def _compile_transformed_factory(
+    *,
+    source: str,
+    starting_line_number: int,
+    filename: str,
+    function_name: str,
+    captured_name_tuple: tuple[str, ...],
+    captured_value_name_tuple: tuple[str, ...],
+) -> CodeType:
+    try:
+        original_module = ast.parse(source)
+        for node in original_module.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == function_name:
+                node.decorator_list = []
+                break
+        ast.increment_lineno(original_module, starting_line_number - 1)
+    except Exception as exception:
+        logging.getLogger("nighthawk").warning("Failed to parse original module AST for %s: %s", function_name, exception)
+        original_module = ast.Module(body=[], type_ignores=[])
+
+    transformed_module = transform_module_ast(original_module, captured_name_tuple=captured_name_tuple)
+
+    factory_module = _build_transformed_factory_module(
+        transformed_module=transformed_module,
+        function_name=function_name,
+        captured_value_name_tuple=captured_value_name_tuple,
+    )
+    return compile(factory_module, filename, "exec")
+
+
 def natural_function(func: NaturalFunctionCallable | None = None) -> NaturalFunctionCallable:
     """Transform a function containing Natural blocks into an executable Natural function.
 
@@ -211,40 +248,25 @@ def natural_function(func: NaturalFunctionCallable | None = None) -> NaturalFunc
     lines, starting_line_number = inspect.getsourcelines(func)
     source = textwrap.dedent("".join(lines))
 
-    try:
-        original_module = ast.parse(source)
-        for node in original_module.body:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == func.__name__:
-                node.decorator_list = []
-                break
-        ast.increment_lineno(original_module, starting_line_number - 1)
-    except Exception as exception:
-        logging.getLogger("nighthawk").warning("Failed to parse original module AST for %s: %s", func.__name__, exception)
-        original_module = ast.Module(body=[], type_ignores=[])
-
-    capture_name_set = _build_capture_name_set(source, func.__name__)
+    captured_name_tuple = _build_capture_name_tuple(source, func.__name__)
 
     definition_frame = inspect.currentframe()
     name_to_value: dict[str, object] = {}
     if definition_frame is not None and definition_frame.f_back is not None:
         caller_frame = definition_frame.f_back
         if caller_frame.f_code.co_name != "<module>":
-            for name in capture_name_set:
+            for name in captured_name_tuple:
                 if name in caller_frame.f_locals:
                     name_to_value[name] = caller_frame.f_locals[name]
 
-    captured_name_tuple = tuple(sorted(capture_name_set))
-
-    transformed_module = transform_module_ast(original_module, captured_name_tuple=captured_name_tuple)
-
-    filename = inspect.getsourcefile(func) or "<nighthawk>"
-
-    factory_module = _build_transformed_factory_module(
-        transformed_module=transformed_module,
+    code = _compile_transformed_factory(
+        source=source,
+        starting_line_number=starting_line_number,
+        filename=inspect.getsourcefile(func) or "<nighthawk>",
         function_name=func.__name__,
-        name_to_value=name_to_value,
+        captured_name_tuple=captured_name_tuple,
+        captured_value_name_tuple=tuple(sorted(name_to_value)),
     )
-    code = compile(factory_module, filename, "exec")
 
     globals_namespace: dict[str, object] = dict(func.__globals__)
     globals_namespace["__nighthawk_runner__"] = _RunnerProxy()
@@ -34,6 +34,8 @@ from .step_contract import (
     build_step_system_prompt_suffix_fragment,
 )
 
+_STEP_OUTCOME_ADAPTER: TypeAdapter[StepOutcome] = TypeAdapter(StepOutcome)
+
 
 @runtime_checkable
 class AsyncExecutionAgent(Protocol):
@@ -280,8 +282,8 @@ class AgentStepExecutor:
             if isinstance(raw_output, StepFinalResult):
                 return raw_output.result
             if isinstance(raw_output, dict) and "result" in raw_output:
-                return TypeAdapter(StepOutcome).validate_python(raw_output["result"])
-            return TypeAdapter(StepOutcome).validate_python(raw_output)
+                return _STEP_OUTCOME_ADAPTER.validate_python(raw_output["result"])
+            return _STEP_OUTCOME_ADAPTER.validate_python(raw_output)
         except Exception as e:
             raise ExecutionError(f"Step produced invalid step outcome: {e}") from e
 
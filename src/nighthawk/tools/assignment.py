@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import functools
 import inspect
 import types
 from typing import Any, NoReturn, get_type_hints
@@ -15,8 +16,12 @@ from ..runtime.step_context import StepContext
 from .contracts import ToolBoundaryError
 
 
+@functools.lru_cache(maxsize=256)
 def _compile_expression(expression: str) -> types.CodeType:
-    """Compile a Python expression with top-level await support."""
+    """Compile a Python expression with top-level await support.
+
+    Code objects are immutable, so repeated expressions reuse one compilation.
+    """
     return compile(
         expression,
         "<nighthawk-eval>",
@@ -65,6 +70,22 @@ def _raise_execution(*, message: str, guidance: str) -> NoReturn:
     raise ToolBoundaryError(kind="execution", message=message, guidance=guidance)
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_type_adapter(expected_type: object, expected_type_repr: str) -> TypeAdapter[Any]:
+    # The repr is only part of the cache key. Reordered unions compare and hash equal
+    # (int | float == float | int), but pydantic's smart-union tie-break depends on member order.
+    _ = expected_type_repr
+    return TypeAdapter(expected_type)
+
+
+def _type_adapter_for(expected_type: object) -> TypeAdapter[Any]:
+    """Return a TypeAdapter for *expected_type*, reusing one per hashable type spelled the same way."""
+    try:
+        return _cached_type_adapter(expected_type, repr(expected_type))
+    except TypeError:
+        return TypeAdapter(expected_type)
+
+
 def _get_pydantic_field_type(model: BaseModel, field_name: str) -> object | None:
     model_fields = getattr(type(model), "model_fields", None)
     if model_fields is None:
@@ -109,7 +130,7 @@ def _assign_value_to_target_path(
 
         if expected_type is not None:
             try:
-                adapted = TypeAdapter(expected_type)
+                adapted = _type_adapter_for(expected_type)
                 value = adapted.validate_python(value)
             except Exception as e:
                 _raise_invalid_input(
@@ -160,7 +181,7 @@ def _assign_value_to_target_path(
 
     if expected_type is not None:
         try:
-            adapted = TypeAdapter(expected_type)
+            adapted = _type_adapter_for(expected_type)
             value = adapted.validate_python(value)
         except Exception as e:
             _raise_invalid_input(
@@ -81,13 +81,19 @@ def _visible_tool_definitions() -> dict[str, ToolDefinition]:
     return merged
 
 
+def _is_tool_name_visible(name: str) -> bool:
+    if name in _builtin_tool_name_to_definition or name in _global_tool_name_to_definition:
+        return True
+
+    return any(name in scope for scope in _tool_scope_stack_var.get()) or any(name in scope for scope in _call_scope_stack_var.get())
+
+
 def _register_tool_definition(tool_definition: ToolDefinition, *, overwrite: bool) -> None:
     ensure_builtin_tools_registered()
 
     name = tool_definition.name
-    visible = _visible_tool_definitions()
 
-    if name in visible and not overwrite:
+    if not overwrite and _is_tool_name_visible(name):
         raise ToolRegistrationError(f"Tool name conflict: {name!r}. Pass overwrite=True to replace the visible definition.")
 
     call_scope_stack = _call_scope_stack_var.get()
@@ -124,9 +130,7 @@ def call_scope() -> Iterator[None]:
 
 
 def get_visible_tools() -> list[Tool[StepContext]]:
-    ensure_builtin_tools_registered()
-    visible = dict(_visible_tool_definitions())
-    return [definition.tool for definition in visible.values()]
+    return [definition.tool for definition in _visible_tool_definitions().values()]
 
 
 type ToolFunction = Callable[..., Any]
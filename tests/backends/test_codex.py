@@ -20,6 +20,17 @@ from nighthawk.tools.registry import get_visible_tools
 _VALID_PNG_HEADER = b"\x89PNG\r\n\x1a\n"
 
 
+def _new_step_context(*, step_id: str) -> StepContext:
+    return StepContext(
+        step_id=step_id,
+        step_globals={"__builtins__": __builtins__},
+        step_locals={},
+        binding_commit_targets=set(),
+        read_binding_names=frozenset(),
+        implicit_reference_name_to_value={},
+    )
+
+
 def test_parse_codex_jsonl_lines_extracts_agent_message_and_thread_id_and_usage() -> None:
     jsonl_lines = [
         json.dumps({"type": "thread.started", "thread_id": "t_123"}),
@@ -324,8 +335,6 @@ if __name__ == "__main__":
 def test_codex_model_contract_calls_tool_via_mcp(tmp_path: Path) -> None:
     codex_executable = _write_executable_codex_stub(directory=tmp_path)
 
-    nh.StepExecutorConfiguration(model="codex:default")
-
     class StubExecutor:
         def run_step(self, **kwargs):  # type: ignore[no-untyped-def]
             _ = kwargs
@@ -334,16 +343,7 @@ def test_codex_model_contract_calls_tool_via_mcp(tmp_path: Path) -> None:
     step_executor = StubExecutor()
 
     with nh.run(step_executor):
-        step_context = StepContext(
-            step_id="test_codex_model_contract_calls_tool_via_mcp",
-            step_globals={"__builtins__": __builtins__},
-            step_locals={},
-            binding_commit_targets=set(),
-            read_binding_names=frozenset(),
-            implicit_reference_name_to_value={},
-        )
-
-        from typing import cast
+        step_context = _new_step_context(step_id="test_codex_model_contract_calls_tool_via_mcp")
 
         model_settings = cast(
             ModelSettings,
@@ -381,14 +381,7 @@ def test_codex_model_contract_calls_tool_via_mcp(tmp_path: Path) -> None:
 def test_codex_model_projects_multimodal_prompt_files_into_working_directory(tmp_path: Path) -> None:
     codex_executable = _write_executable_codex_prompt_echo_stub(directory=tmp_path)
 
-    step_context = StepContext(
-        step_id="test_codex_model_projects_multimodal_prompt_files_into_working_directory",
-        step_globals={"__builtins__": __builtins__},
-        step_locals={},
-        binding_commit_targets=set(),
-        read_binding_names=frozenset(),
-        implicit_reference_name_to_value={},
-    )
+    step_context = _new_step_context(step_id="test_codex_model_projects_multimodal_prompt_files_into_working_directory")
 
     model_settings = cast(
         ModelSettings,
@@ -427,14 +420,7 @@ def test_codex_model_projects_multimodal_prompt_files_into_current_working_direc
     current_working_directory.mkdir()
     monkeypatch.chdir(current_working_directory)
 
-    step_context = StepContext(
-        step_id="test_codex_model_projects_multimodal_prompt_files_into_current_working_directory_when_unset",
-        step_globals={"__builtins__": __builtins__},
-        step_locals={},
-        binding_commit_targets=set(),
-        read_binding_names=frozenset(),
-        implicit_reference_name_to_value={},
-    )
+    step_context = _new_step_context(step_id="test_codex_model_projects_multimodal_prompt_files_into_current_working_directory_when_unset")
 
     model_settings = cast(
         ModelSettings,
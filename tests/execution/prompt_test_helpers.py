@@ -10,6 +10,7 @@ import nighthawk as nh
 from nighthawk.runtime.prompt import build_user_prompt
 from nighthawk.runtime.runner import _discover_implicit_type_alias_reference_names
 from nighthawk.runtime.step_context import StepContext
+from nighthawk.runtime.step_contract import PassStepOutcome, StepFinalResult
 
 _DEFAULT_EXECUTOR_CONFIGURATION = nh.StepExecutorConfiguration()
 
@@ -24,8 +25,6 @@ class FakeAgent:
         self.seen_prompts: list[str | tuple[UserContent, ...]] = []
 
     def run_sync(self, user_prompt, *, deps=None, **kwargs):  # type: ignore[no-untyped-def]
-        from nighthawk.runtime.step_contract import PassStepOutcome, StepFinalResult
-
         self.seen_prompts.append(user_prompt)
         assert deps is not None
         _ = kwargs
@@ -117,9 +116,15 @@ def build_user_prompt_content(
     )
 
 
+def _section_text(prompt: str, *, start_marker: str, end_marker: str) -> str:
+    start_index = prompt.index(start_marker) + len(start_marker)
+    end_index = prompt.find(end_marker, start_index)
+    return prompt[start_index:] if end_index == -1 else prompt[start_index:end_index]
+
+
 def globals_section(prompt: str) -> str:
-    return prompt.split("<<<NH:GLOBALS>>>\n", 1)[1].split("\n<<<NH:END_GLOBALS>>>", 1)[0]
+    return _section_text(prompt, start_marker="<<<NH:GLOBALS>>>\n", end_marker="\n<<<NH:END_GLOBALS>>>")
 
 
 def locals_section(prompt: str) -> str:
-    return prompt.split("<<<NH:LOCALS>>>\n", 1)[1].split("\n<<<NH:END_LOCALS>>>", 1)[0]
+    return _section_text(prompt, start_marker="<<<NH:LOCALS>>>\n", end_marker="\n<<<NH:END_LOCALS>>>")
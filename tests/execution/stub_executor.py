@@ -8,6 +8,8 @@ from pydantic import TypeAdapter
 from nighthawk.errors import ExecutionError
 from nighthawk.runtime.step_contract import StepKind, StepOutcome
 
+_STEP_OUTCOME_ADAPTER: TypeAdapter[StepOutcome] = TypeAdapter(StepOutcome)
+
 
 @dataclass(frozen=True)
 class StubExecutor:
@@ -53,7 +55,7 @@ class StubExecutor:
             raise ExecutionError("Stub execution expected 'bindings' in envelope")
 
         try:
-            step_outcome = TypeAdapter(StepOutcome).validate_python(data["step_outcome"])
+            step_outcome = _STEP_OUTCOME_ADAPTER.validate_python(data["step_outcome"])
         except Exception as e:
             raise ExecutionError(f"Stub execution has invalid step_outcome: {e}") from e
 
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
 
 import pytest
 
 import nighthawk as nh
+from nighthawk.runtime.runner import Runner
 from nighthawk.runtime.step_context import StepContext
-from nighthawk.runtime.step_contract import PassStepOutcome, StepKind
+from nighthawk.runtime.step_contract import PassStepOutcome, StepFinalResult, StepKind
+from nighthawk.tools.assignment import assign_tool
+from tests.execution.prompt_test_helpers import FakeAgent, FakeRunResult
 
 NATURAL_BLOCK_ORDERING_GLOBAL_NUMBER = 7
 
 
 def test_docstring_step_executes_first_and_name_is_undefined() -> None:
-    nh.StepExecutorConfiguration()
-
     @dataclass
     class NoopExecutor:
         def run_step(
@@ -49,8 +51,6 @@ def test_docstring_step_executes_first_and_name_is_undefined() -> None:
 
 
 def test_missing_input_binding_raises_even_if_program_text_does_not_use_it() -> None:
-    nh.StepExecutorConfiguration()
-
     @dataclass
     class NoopExecutor:
         def run_step(
@@ -81,19 +81,10 @@ def test_missing_input_binding_raises_even_if_program_text_does_not_use_it() ->
 
 
 def test_input_binding_globals_are_injected_into_step_locals_for_agent_tool_eval() -> None:
-    nh.StepExecutorConfiguration()
-
     GLOBAL_NUMBER = NATURAL_BLOCK_ORDERING_GLOBAL_NUMBER  # noqa: N806
 
-    class FakeRunResult:
-        def __init__(self, output: object):
-            self.output = output
-
-    class FakeAgent:
+    class AssigningFakeAgent:
         def run_sync(self, user_prompt: str, *, deps=None, **kwargs):
-            from nighthawk.runtime.step_contract import PassStepOutcome, StepFinalResult
-            from nighthawk.tools.assignment import assign_tool
-
             assert deps is not None
             _ = user_prompt
             _ = kwargs
@@ -102,7 +93,7 @@ def test_input_binding_globals_are_injected_into_step_locals_for_agent_tool_eval
 
             return FakeRunResult(StepFinalResult(result=PassStepOutcome(kind="pass")))
 
-    with nh.run(nh.AgentStepExecutor.from_agent(agent=FakeAgent())):
+    with nh.run(nh.AgentStepExecutor.from_agent(agent=AssigningFakeAgent())):
 
         @nh.natural_function
         def f() -> int:
@@ -117,27 +108,8 @@ def test_input_binding_globals_are_injected_into_step_locals_for_agent_tool_eval
 
 
 def test_agent_backend_commits_only_on_assignment() -> None:
-    nh.StepExecutorConfiguration()
-
-    class FakeRunResult:
-        def __init__(self, output: object):
-            self.output = output
-
-    class FakeAgent:
-        def run_sync(self, user_prompt: str, *, deps=None, **kwargs):
-            from nighthawk.runtime.step_contract import PassStepOutcome, StepFinalResult
-
-            assert deps is not None
-            _ = user_prompt
-            _ = kwargs
-
-            return FakeRunResult(StepFinalResult(result=PassStepOutcome(kind="pass")))
-
     with nh.run(nh.AgentStepExecutor.from_agent(agent=FakeAgent())):
-        from nighthawk.runtime.runner import Runner
-
         runner = Runner(nh.get_step_executor())
-        import inspect
 
         frame = inspect.currentframe()
         assert frame is not None
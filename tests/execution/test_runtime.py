@@ -13,6 +13,9 @@ from nighthawk.errors import ExecutionError, NighthawkError
 from nighthawk.runtime.prompt import build_system_prompt, resolve_step_system_prompt_template_text
 from nighthawk.runtime.step_context import StepContext
 from nighthawk.runtime.step_contract import PassStepOutcome, ReturnStepOutcome, StepFinalResult, StepKind
+from nighthawk.testing import CallbackExecutor, ScriptedExecutor, pass_response
+from nighthawk.tools.assignment import assign_tool
+from tests.execution.prompt_test_helpers import FakeRunResult
 from tests.execution.stub_executor import StubExecutor
 
 GLOBAL_NUMBER = 7
@@ -101,8 +104,6 @@ def test_sync_step_execution_sets_execution_ref_step_id() -> None:
 
 
 def test_natural_function_updates_output_binding_via_docstring_step():
-    nh.StepExecutorConfiguration()
-
     @dataclass
     class AssertingExecutor:
         def run_step(
@@ -136,8 +137,6 @@ def test_natural_function_updates_output_binding_via_docstring_step():
 
 
 def test_async_natural_function_updates_output_binding_via_docstring_step():
-    nh.StepExecutorConfiguration()
-
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -239,8 +238,6 @@ def test_async_step_execution_sets_execution_ref_step_id() -> None:
 
 
 def test_async_natural_function_awaits_awaitable_return_value_from_step_executor():
-    nh.StepExecutorConfiguration()
-
     @dataclass
     class AssertingExecutor:
         def run_step(
@@ -288,8 +285,6 @@ def test_async_natural_function_awaits_awaitable_return_value_from_step_executor
 
 
 def test_sync_natural_function_rejects_awaitable_return_value_from_step_executor():
-    nh.StepExecutorConfiguration()
-
     class AwaitableInt:
         def __await__(self):  # type: ignore[no-untyped-def]
             if False:
@@ -326,8 +321,6 @@ def test_sync_natural_function_rejects_awaitable_return_value_from_step_executor
 
 
 def test_async_natural_function_allows_self_reference_freevar():
-    nh.StepExecutorConfiguration()
-
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -343,8 +336,6 @@ def test_async_natural_function_allows_self_reference_freevar():
 
 
 def test_natural_function_supports_instance_method():
-    nh.StepExecutorConfiguration()
-
     with nh.run(StubExecutor()):
 
         class NaturalMethodCarrier:
@@ -362,8 +353,6 @@ def test_natural_function_supports_instance_method():
 
 
 def test_natural_function_supports_staticmethod_for_both_decorator_orders():
-    nh.StepExecutorConfiguration()
-
     with nh.run(StubExecutor()):
 
         class NaturalStaticMethodCarrier:
@@ -394,8 +383,6 @@ def test_natural_function_supports_staticmethod_for_both_decorator_orders():
 
 
 def test_natural_function_supports_classmethod_for_both_decorator_orders():
-    nh.StepExecutorConfiguration()
-
     with nh.run(StubExecutor()):
 
         class NaturalClassMethodCarrier:
@@ -428,8 +415,6 @@ def test_natural_function_supports_classmethod_for_both_decorator_orders():
 
 
 def test_natural_function_supports_async_instance_method():
-    nh.StepExecutorConfiguration()
-
     with nh.run(StubExecutor()):
 
         class NaturalAsyncMethodCarrier:
@@ -447,8 +432,6 @@ def test_natural_function_supports_async_instance_method():
 
 
 def test_natural_function_supports_async_staticmethod_for_both_decorator_orders():
-    nh.StepExecutorConfiguration()
-
     with nh.run(StubExecutor()):
 
         class NaturalAsyncStaticMethodCarrier:
@@ -479,8 +462,6 @@ def test_natural_function_supports_async_staticmethod_for_both_decorator_orders(
 
 
 def test_natural_function_supports_async_classmethod_for_both_decorator_orders():
-    nh.StepExecutorConfiguration()
-
     with nh.run(StubExecutor()):
 
         class NaturalAsyncClassMethodCarrier:
@@ -513,7 +494,6 @@ def test_natural_function_supports_async_classmethod_for_both_decorator_orders()
 
 
 def test_stub_return_effect_returns_value_from_return_expression():
-    nh.StepExecutorConfiguration()
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -529,7 +509,6 @@ def test_stub_return_effect_returns_value_from_return_expression():
 
 
 def test_stub_return_effect_invalid_return_value_raises():
-    nh.StepExecutorConfiguration()
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -546,7 +525,6 @@ def test_stub_return_effect_invalid_return_value_raises():
 
 
 def test_stub_return_effect_invalid_return_expression_raises():
-    nh.StepExecutorConfiguration()
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -561,7 +539,6 @@ def test_stub_return_effect_invalid_return_expression_raises():
 
 
 def test_stub_continue_effect_skips_following_statements():
-    nh.StepExecutorConfiguration()
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -579,7 +556,6 @@ def test_stub_continue_effect_skips_following_statements():
 
 
 def test_stub_break_effect_breaks_loop():
-    nh.StepExecutorConfiguration()
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -597,7 +573,6 @@ def test_stub_break_effect_breaks_loop():
 
 
 def test_stub_break_outside_loop_raises():
-    nh.StepExecutorConfiguration()
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -612,8 +587,6 @@ def test_stub_break_outside_loop_raises():
 
 
 def test_docstring_step_is_literal_no_implicit_interpolation():
-    nh.StepExecutorConfiguration()
-
     @dataclass
     class RecordingExecutor:
         seen_programs: list[str] = field(default_factory=list)
@@ -648,7 +621,6 @@ def test_docstring_step_is_literal_no_implicit_interpolation():
 
 
 def test_frontmatter_deny_return_rejects_return_step():
-    nh.StepExecutorConfiguration()
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -667,7 +639,6 @@ def test_frontmatter_deny_return_rejects_return_step():
 
 
 def test_frontmatter_deny_return_recognizes_leading_blank_lines():
-    nh.StepExecutorConfiguration()
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -689,7 +660,6 @@ def test_frontmatter_deny_return_recognizes_leading_blank_lines():
 
 
 def test_frontmatter_deny_return_allows_bindings():
-    nh.StepExecutorConfiguration()
     with nh.run(StubExecutor()):
 
         @nh.natural_function
@@ -716,6 +686,31 @@ def test_frontmatter_deny_return_allows_bindings():
         assert f(10) == 11
 
 
+def test_natural_function_redefined_in_enclosing_function_captures_each_definition_values():
+    def build_natural_function(offset: int):  # type: ignore[no-untyped-def]
+        @nh.natural_function
+        def f(x: int):
+            envelope_json_text = json.dumps(
+                {
+                    "step_outcome": {"kind": "pass"},
+                    "bindings": {"result": x + offset},
+                }
+            )
+
+            f"""natural
+            <offset>
+            <:result>
+            {envelope_json_text}
+            """
+            return result  # noqa: F821  # pyright: ignore[reportUndefinedVariable]
+
+        return f
+
+    with nh.run(StubExecutor()):
+        assert build_natural_function(1)(10) == 11
+        assert build_natural_function(5)(10) == 15
+
+
 def test_step_system_prompt_omits_preview_budget_by_default() -> None:
     configuration = nh.StepExecutorConfiguration(
         context_limits=nh.StepContextLimits(
@@ -760,14 +755,8 @@ def test_system_prompt_suffix_fragment_injects_tool_result_max_tokens() -> None:
 
 
 def test_agent_executor_commits_write_binding_after_dotted_assignment() -> None:
-    class FakeRunResult:
-        def __init__(self, output: object) -> None:
-            self.output = output
-
     class FakeAgent:
         def run_sync(self, user_prompt: str, *, deps=None, **kwargs):  # type: ignore[no-untyped-def]
-            from nighthawk.tools.assignment import assign_tool
-
             assert deps is not None
             _ = user_prompt
             _ = kwargs
@@ -790,10 +779,6 @@ def test_agent_executor_commits_write_binding_after_dotted_assignment() -> None:
 
 
 def test_agent_executor_passes_plain_string_to_text_only_custom_agent() -> None:
-    class FakeRunResult:
-        def __init__(self, output: object) -> None:
-            self.output = output
-
     class RecordingAgent:
         def __init__(self) -> None:
             self.seen_prompt_type_list: list[type[object]] = []
@@ -820,10 +805,6 @@ def test_agent_executor_passes_plain_string_to_text_only_custom_agent() -> None:
 
 
 def test_agent_executor_passes_multimodal_tuple_to_custom_agent() -> None:
-    class FakeRunResult:
-        def __init__(self, output: object) -> None:
-            self.output = output
-
     class RecordingAgent:
         def __init__(self) -> None:
             self.seen_prompt_list: list[object] = []
@@ -854,18 +835,11 @@ def test_agent_executor_passes_multimodal_tuple_to_custom_agent() -> None:
 
 
 def test_natural_function_can_override_step_executor_configuration_model_within_scope() -> None:
-    class FakeRunResult:
-        def __init__(self, output: object) -> None:
-            self.output = output
-
     class RecordingAgent:
         def __init__(self) -> None:
             self.seen_model_identifiers: list[str] = []
 
         def run_sync(self, user_prompt: str, *, deps=None, **kwargs):  # type: ignore[no-untyped-def]
-            from nighthawk.runtime.step_contract import PassStepOutcome, StepFinalResult
-            from nighthawk.tools.assignment import assign_tool
-
             assert deps is not None
             _ = user_prompt
             _ = kwargs
@@ -942,8 +916,6 @@ def test_natural_function_rejects_step_executor_configuration_updates_for_non_ag
 
 
 def test_scope_implicit_references_are_merged_into_step_context() -> None:
-    from nighthawk.testing import CallbackExecutor, pass_response
-
     observed_implicit_reference_name_set: set[str] = set()
 
     def search_repository(query: str) -> list[str]:
@@ -972,7 +944,6 @@ def test_scope_implicit_references_are_merged_into_step_context() -> None:
 
 def test_unannotated_binding_type_inferred_from_initial_value():
     """binding_name_to_type should reflect the inferred type for unannotated write bindings."""
-    from nighthawk.testing import ScriptedExecutor, pass_response
 
     executor = ScriptedExecutor(responses=[pass_response(result="hello")])
     with nh.run(executor):
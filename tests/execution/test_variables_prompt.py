@@ -5,11 +5,14 @@ from collections import namedtuple
 from dataclasses import dataclass
 from typing import Literal
 
+import tiktoken
 from pydantic import BaseModel
 from pydantic_ai.messages import AudioUrl, BinaryContent, ImageUrl, TextContent, UploadedFile
 
 import nighthawk as nh
 from nighthawk.resilience import fallback
+from nighthawk.runtime._user_content import coalesce_user_content
+from nighthawk.runtime.prompt import _count_prompt_line_tokens
 from tests.execution.prompt_test_helpers import (
     FakeAgent,
     build_step_context,
@@ -1229,17 +1232,11 @@ def test_multimodal_binding_charges_internal_token_budget() -> None:
 
 
 def test_coalesce_prompt_content_merges_text_content() -> None:
-    from nighthawk.runtime._user_content import coalesce_user_content
-
     result = coalesce_user_content(["hello ", TextContent(content="world")])
     assert result == ("hello world",)
 
 
 def test_count_prompt_line_tokens_handles_text_content() -> None:
-    import tiktoken
-
-    from nighthawk.runtime.prompt import _count_prompt_line_tokens
-
     encoding = tiktoken.get_encoding("o200k_base")
     tokens = _count_prompt_line_tokens(
         prompt_line=(TextContent(content="hello world"),),
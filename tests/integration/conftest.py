@@ -0,0 +1,98 @@
+import importlib.util
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import nighthawk as nh
+
+_INTEGRATION_TEST_DIRECTORY = Path(__file__).absolute().parent
+_AGENT_WORKING_DIRECTORY_TEMPLATE = _INTEGRATION_TEST_DIRECTORY / "agent_working_directory"
+_BACKEND_PROBE_TEST_PATH = _INTEGRATION_TEST_DIRECTORY / "test_coding_agent_integration.py"
+
+# Skill tests drive a full coding-agent session (skill lookup, shell commands, MCP callbacks), which
+# routinely takes a few minutes, so the default is far above a single model call.
+_INTEGRATION_TEST_TIMEOUT_SECONDS = int(os.getenv("NIGHTHAWK_INTEGRATION_TEST_TIMEOUT_SECONDS", "600"))
+
+_OPENAI_INTEGRATION_ENVIRONMENT_VARIABLE_NAME = "NIGHTHAWK_OPENAI_INTEGRATION_TESTS"
+_CODING_AGENT_INTEGRATION_ENVIRONMENT_VARIABLE_NAME_TUPLE = (
+    "NIGHTHAWK_CODEX_INTEGRATION_TESTS",
+    "NIGHTHAWK_CLAUDE_SDK_INTEGRATION_TESTS",
+    "NIGHTHAWK_CLAUDE_CLI_INTEGRATION_TESTS",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _configure_logfire() -> None:
+    # Configure and instrument once per session; repeated calls re-register span processors and MCP patches.
+    coding_agent_integration_enabled = any(os.getenv(name) == "1" for name in _CODING_AGENT_INTEGRATION_ENVIRONMENT_VARIABLE_NAME_TUPLE)
+    if not coding_agent_integration_enabled and os.getenv(_OPENAI_INTEGRATION_ENVIRONMENT_VARIABLE_NAME) != "1":
+        return
+
+    import logfire
+
+    if not coding_agent_integration_enabled:
+        # OpenAI-only runs keep the plain setup the LLM integration module used before.
+        logfire.configure(send_to_logfire="if-token-present")
+        logfire.instrument_pydantic_ai()
+        return
+
+    logfire.configure(send_to_logfire="if-token-present", console=logfire.ConsoleOptions(verbose=True))
+    # mcp ships only with the codex and claude-code-cli extras.
+    if importlib.util.find_spec("mcp") is not None:
+        logfire.instrument_mcp()
+    logfire.instrument_pydantic_ai(event_mode="logs")
+
+
+def _new_openai_step_executor(*, model: str, openai_reasoning_effort: str) -> nh.AgentStepExecutor:
+    openai_responses_model_settings_class = pytest.importorskip("pydantic_ai.models.openai").OpenAIResponsesModelSettings
+
+    return nh.AgentStepExecutor.from_configuration(
+        configuration=nh.StepExecutorConfiguration(
+            model=model,
+            model_settings=openai_responses_model_settings_class(openai_reasoning_effort=openai_reasoning_effort),
+        ),
+    )
+
+
+# One step executor per (model, reasoning effort) pair for the whole session. The executor only holds the
+# configured agent; tools, scopes, and step locals are resolved per step, so tests can share it safely.
+# Tests that request these fixtures are gated with the requires_openai_integration marker.
+@pytest.fixture(scope="session")
+def openai_nano_low_step_executor() -> nh.AgentStepExecutor:
+    return _new_openai_step_executor(model="openai-responses:gpt-5.4-nano", openai_reasoning_effort="low")
+
+
+@pytest.fixture(scope="session")
+def openai_nano_medium_step_executor() -> nh.AgentStepExecutor:
+    return _new_openai_step_executor(model="openai-responses:gpt-5.4-nano", openai_reasoning_effort="medium")
+
+
+@pytest.fixture(scope="session")
+def openai_mini_high_step_executor() -> nh.AgentStepExecutor:
+    return _new_openai_step_executor(model="openai-responses:gpt-5.4-mini", openai_reasoning_effort="high")
+
+
+@pytest.fixture(scope="module")
+def agent_working_directory(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Copy the skill scaffolding per module so skill tests can share one step executor
+    # without writing into the repository.
+    # Resolved so it matches the realpath an agent reports from `pwd` (e.g. /private/var on macOS).
+    working_directory = (tmp_path_factory.mktemp("agent") / "agent_working_directory").resolve()
+    shutil.copytree(_AGENT_WORKING_DIRECTORY_TEMPLATE, working_directory, symlinks=True)
+    return working_directory
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # pytest passes every collected item to this hook, so only integration items are touched.
+    integration_index_list = [index for index, item in enumerate(items) if item.path.is_relative_to(_INTEGRATION_TEST_DIRECTORY)]
+
+    for index in integration_index_list:
+        items[index].add_marker(pytest.mark.timeout(_INTEGRATION_TEST_TIMEOUT_SECONDS))
+
+    # Run the one-line backend probes first within the integration tests so broken credentials or missing
+    # CLIs fail the run early; the sort is stable, so the remaining order is unchanged.
+    integration_item_list = sorted((items[index] for index in integration_index_list), key=lambda item: item.path != _BACKEND_PROBE_TEST_PATH)
+    for index, item in zip(integration_index_list, integration_item_list, strict=True):
+        items[index] = item
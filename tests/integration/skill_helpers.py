@@ -0,0 +1,47 @@
+"""Shared skill scenarios for coding-agent integration tests.
+
+Call these inside ``nh.run`` with a step executor whose working directory is a
+copy of ``agent_working_directory``, which provides the ``hoge`` and ``test`` skills.
+"""
+
+from pathlib import Path
+
+import nighthawk as nh
+
+
+def execute_hoge_skill(working_directory: Path, *, pwd_command: str) -> None:
+    @nh.natural_function
+    def test_function():
+        f"""natural
+        ---
+        deny: [pass, raise]
+        ---
+        Execute the `hoge` skill.
+        Then, without changing the current working directory, return the result of the `{pwd_command}` command.
+        """  # noqa: B021
+
+    result = test_function()
+
+    assert isinstance(result, str)
+    assert Path(result) == working_directory
+    assert (working_directory / "test.txt").is_file()
+
+
+def execute_test_skill() -> None:
+    @nh.natural_function
+    def test_function():
+        def calc(a, b):
+            return a + b * 8
+
+        """natural
+        ---
+        deny: [pass, raise]
+        ---
+        Execute the `test` skill.
+        """
+
+        return result
+
+    result = test_function()
+
+    assert result == 1 + 2 * 8
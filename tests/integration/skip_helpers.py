@@ -5,40 +5,56 @@ import os
 import pytest
 
 
-def requires_openai_integration():  # type: ignore[no-untyped-def]
+def _openai_integration_skip_reason() -> str | None:
     if os.getenv("NIGHTHAWK_OPENAI_INTEGRATION_TESTS") != "1":
-        pytest.skip("Integration tests are disabled")
+        return "Integration tests are disabled"
 
     if os.getenv("OPENAI_API_KEY") is None:
-        pytest.skip("OPENAI_API_KEY is required for OpenAI integration tests")
+        return "OPENAI_API_KEY is required for OpenAI integration tests"
 
-    openai_module = pytest.importorskip("pydantic_ai.models.openai")
-    return openai_module.OpenAIResponsesModelSettings
+    return None
 
 
-def requires_codex_integration() -> None:
+def _codex_integration_skip_reason() -> str | None:
     import shutil
 
     if os.getenv("NIGHTHAWK_CODEX_INTEGRATION_TESTS") != "1":
-        pytest.skip("Integration tests are disabled")
+        return "Integration tests are disabled"
 
     if shutil.which("codex") is None:
-        pytest.skip("Codex CLI integration test requires 'codex' on PATH")
+        return "Codex CLI integration test requires 'codex' on PATH"
 
+    return None
 
-def requires_claude_code_sdk_integration() -> None:
+
+def _claude_code_sdk_integration_skip_reason() -> str | None:
     if os.getenv("NIGHTHAWK_CLAUDE_SDK_INTEGRATION_TESTS") != "1":
-        pytest.skip("Integration tests are disabled")
+        return "Integration tests are disabled"
 
     if os.getenv("ANTHROPIC_AUTH_TOKEN") is None and os.getenv("ANTHROPIC_API_KEY") is None:
-        pytest.skip("Claude Code integration test requires ANTHROPIC_AUTH_TOKEN or ANTHROPIC_API_KEY")
+        return "Claude Code integration test requires ANTHROPIC_AUTH_TOKEN or ANTHROPIC_API_KEY"
+
+    return None
 
 
-def requires_claude_code_cli_integration() -> None:
+def _claude_code_cli_integration_skip_reason() -> str | None:
     import shutil
 
     if os.getenv("NIGHTHAWK_CLAUDE_CLI_INTEGRATION_TESTS") != "1":
-        pytest.skip("Integration tests are disabled")
+        return "Integration tests are disabled"
 
     if shutil.which("claude") is None:
-        pytest.skip("Claude Code CLI integration test requires 'claude' on PATH")
+        return "Claude Code CLI integration test requires 'claude' on PATH"
+
+    return None
+
+
+def _skip_unless_enabled(skip_reason: str | None) -> pytest.MarkDecorator:
+    return pytest.mark.skipif(skip_reason is not None, reason=skip_reason or "")
+
+
+# Evaluated once at import so skipped tests are filtered at collection time.
+requires_openai_integration = _skip_unless_enabled(_openai_integration_skip_reason())
+requires_codex_integration = _skip_unless_enabled(_codex_integration_skip_reason())
+requires_claude_code_sdk_integration = _skip_unless_enabled(_claude_code_sdk_integration_skip_reason())
+requires_claude_code_cli_integration = _skip_unless_enabled(_claude_code_cli_integration_skip_reason())
@@ -4,18 +4,10 @@ import nighthawk as nh
 from tests.integration.skip_helpers import requires_openai_integration
 
 
-def test_carry_continuity_across_blocks():
+@requires_openai_integration
+def test_carry_continuity_across_blocks(openai_nano_medium_step_executor: nh.AgentStepExecutor):
     """Carry list carries context from step 1 into step 2 via in-place mutation."""
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano",
-            model_settings=openai_responses_model_settings_class(openai_reasoning_effort="medium"),
-        ),
-    )
-
-    with nh.run(step_executor):
+    with nh.run(openai_nano_medium_step_executor):
 
         @nh.natural_function
         def step_1(carry: list[str]) -> int:
@@ -47,18 +39,10 @@ def test_carry_continuity_across_blocks():
         assert len(carry) >= 2
 
 
-def test_carry_branching():
+@requires_openai_integration
+def test_carry_branching(openai_nano_low_step_executor: nh.AgentStepExecutor):
     """Branching a carry creates independent continuations."""
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano",
-            model_settings=openai_responses_model_settings_class(openai_reasoning_effort="low"),
-        ),
-    )
-
-    with nh.run(step_executor):
+    with nh.run(openai_nano_low_step_executor):
 
         @nh.natural_function
         def seed_step(carry: list[str]) -> int:
@@ -109,18 +93,10 @@ def test_carry_branching():
         assert len(carry_b) >= 2
 
 
-def test_carry_with_fstring_injection():
+@requires_openai_integration
+def test_carry_with_fstring_injection(openai_nano_low_step_executor: nh.AgentStepExecutor):
     """f-string inline block injects carry content directly into the Natural program text."""
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano",
-            model_settings=openai_responses_model_settings_class(openai_reasoning_effort="low"),
-        ),
-    )
-
-    with nh.run(step_executor):
+    with nh.run(openai_nano_low_step_executor):
 
         @nh.natural_function
         def compute_with_context(context_text: str) -> int:
@@ -1,157 +1,43 @@
 from pathlib import Path
 
+import pytest
+
 import nighthawk as nh
+from nighthawk.backends.claude_code_sdk import ClaudeCodeSdkModelSettings
+from tests.integration.skill_helpers import execute_hoge_skill, execute_test_skill
 from tests.integration.skip_helpers import requires_claude_code_sdk_integration
 
 
-def test_claude_code_natural_step_uses_tool(tmp_path: Path) -> None:
-    requires_claude_code_sdk_integration()
-
-    import logfire
-
-    logfire.configure(send_to_logfire="if-token-present")
-    logfire.instrument_mcp()
-    logfire.instrument_pydantic_ai()
-
-    from nighthawk.backends.claude_code_sdk import ClaudeCodeSdkModelSettings
-
-    run_configuration = nh.StepExecutorConfiguration(
-        model="claude-code-sdk:sonnet",
-        model_settings=ClaudeCodeSdkModelSettings(
-            working_directory=str(tmp_path.resolve()),
-        ).model_dump(),
-    )
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=run_configuration,
-    )
-
-    with nh.run(step_executor):
-
-        @nh.natural_function
-        def test_function() -> str:
-            result = ""
-            """natural
-            Set <:result> to "2".
-            """
-
-            return result
-
-        assert test_function() == "2"
-
-
-def test_claude_skill() -> None:
-    requires_claude_code_sdk_integration()
-
-    import logfire
-
-    logfire.configure(send_to_logfire="if-token-present", console=logfire.ConsoleOptions(verbose=True))
-    logfire.instrument_pydantic_ai()
-
-    from nighthawk.backends.claude_code_sdk import ClaudeCodeSdkModelSettings
-
-    working_directory = Path(__file__).absolute().parent / "agent_working_directory"
-
-    try:
-        (working_directory / "test.txt").unlink(missing_ok=True)
-
-        configuration = nh.StepExecutorConfiguration(
-            model="claude-code-sdk:sonnet",
-            model_settings=ClaudeCodeSdkModelSettings(
-                permission_mode="bypassPermissions",
-                setting_sources=["project"],
-                claude_allowed_tool_names=("Skill", "Bash"),
-                working_directory=str(working_directory.resolve()),
-            ).model_dump(),
-        )
-
-        step_executor = nh.AgentStepExecutor.from_configuration(
-            configuration=configuration,
-        )
-        with nh.run(step_executor):
-
-            @nh.natural_function
-            def test_function():
-                """natural
-                ---
-                deny: [pass, raise]
-                ---
-                Execute the `hoge` skill.
-                Then, without changing the current working directory, return the result of the `pwd` command.
-                """
-
-            result = test_function()
-
-            assert result == str(working_directory)
-            assert (working_directory / "test.txt").is_file()
-    finally:
-        (working_directory / "test.txt").unlink(missing_ok=True)
-
-
-def test_claude_skill_calc() -> None:
-    requires_claude_code_sdk_integration()
-
-    import logfire
-
-    logfire.configure(send_to_logfire="if-token-present", console=logfire.ConsoleOptions(verbose=True))
-    logfire.instrument_pydantic_ai()
-
-    from nighthawk.backends.claude_code_sdk import ClaudeCodeSdkModelSettings
-
-    working_directory = Path(__file__).absolute().parent / "agent_working_directory"
-
+def _new_skill_step_executor(*, model: str, working_directory: Path) -> nh.AgentStepExecutor:
     configuration = nh.StepExecutorConfiguration(
-        model="claude-code-sdk:haiku",
+        model=model,
         model_settings=ClaudeCodeSdkModelSettings(
             permission_mode="bypassPermissions",
             setting_sources=["project"],
             claude_allowed_tool_names=("Skill", "Bash"),
-            working_directory=str(working_directory.resolve()),
+            working_directory=str(working_directory),
         ).model_dump(),
     )
 
-    step_executor = nh.AgentStepExecutor.from_configuration(
+    return nh.AgentStepExecutor.from_configuration(
         configuration=configuration,
     )
-    with nh.run(step_executor):
 
-        @nh.natural_function
-        def test_function():
-            def calc(a, b):
-                return a + b * 8
 
-            """natural
-            ---
-            deny: [pass, raise]
-            ---
-            Execute the `test` skill.
-            """
-
-            return result
-
-        result = test_function()
-
-        assert result == 1 + 2 * 8
+@pytest.fixture(scope="module")
+def skill_step_executor(agent_working_directory: Path) -> nh.AgentStepExecutor:
+    return _new_skill_step_executor(model="claude-code-sdk:sonnet", working_directory=agent_working_directory)
 
 
-def test_claude_mcp_callback() -> None:
-    requires_claude_code_sdk_integration()
-
-    import logfire
-
-    logfire.configure(
-        send_to_logfire="if-token-present",
-        console=logfire.ConsoleOptions(
-            verbose=True,
-        ),
-    )
-    logfire.instrument_mcp()
-    logfire.instrument_pydantic_ai(
-        event_mode="logs",
-    )
+@pytest.fixture(scope="module")
+def haiku_skill_step_executor(agent_working_directory: Path) -> nh.AgentStepExecutor:
+    return _new_skill_step_executor(model="claude-code-sdk:haiku", working_directory=agent_working_directory)
 
-    from nighthawk.backends.claude_code_sdk import ClaudeCodeSdkModelSettings
 
+@pytest.fixture(scope="module")
+def haiku_step_executor() -> nh.AgentStepExecutor:
+    # Built once per module; the backend still opens a fresh Claude Agent SDK client per request
+    # because its options carry the request-specific MCP tools and system prompt.
     configuration = nh.StepExecutorConfiguration(
         model="claude-code-sdk:haiku",
         model_settings=ClaudeCodeSdkModelSettings(
@@ -161,10 +47,26 @@ def test_claude_mcp_callback() -> None:
         ).model_dump(),
     )
 
-    step_executor = nh.AgentStepExecutor.from_configuration(
+    return nh.AgentStepExecutor.from_configuration(
         configuration=configuration,
     )
-    with nh.run(step_executor):
+
+
+@requires_claude_code_sdk_integration
+def test_claude_skill(skill_step_executor: nh.AgentStepExecutor, agent_working_directory: Path) -> None:
+    with nh.run(skill_step_executor):
+        execute_hoge_skill(agent_working_directory, pwd_command="pwd")
+
+
+@requires_claude_code_sdk_integration
+def test_claude_skill_calc(haiku_skill_step_executor: nh.AgentStepExecutor) -> None:
+    with nh.run(haiku_skill_step_executor):
+        execute_test_skill()
+
+
+@requires_claude_code_sdk_integration
+def test_claude_mcp_callback(haiku_step_executor: nh.AgentStepExecutor) -> None:
+    with nh.run(haiku_step_executor):
 
         @nh.natural_function
         def test_function():
@@ -1,44 +1,19 @@
 from pathlib import Path
 
+import pytest
+
 import nighthawk as nh
+from nighthawk.backends.codex import CodexModelSettings
+from tests.integration.skill_helpers import execute_hoge_skill, execute_test_skill
 from tests.integration.skip_helpers import requires_codex_integration
 
 
-def test_codex_natural_step_uses_tool(tmp_path: Path) -> None:
-    requires_codex_integration()
-
-    run_configuration = nh.StepExecutorConfiguration(
-        model="codex:gpt-5.4-mini",
-        model_settings={
-            "working_directory": str(tmp_path.resolve()),
-        },
-    )
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=run_configuration,
-    )
-
-    with nh.run(step_executor):
-
-        @nh.natural_function
-        def test_function() -> str:
-            result = ""
-            """natural
-            Set <:result> to "2".
-            """
-
-            return result
-
-        assert test_function() == "2"
-
-
+@requires_codex_integration
 def test_codex_natural_step_uses_custom_nh_tool(tmp_path: Path) -> None:
-    requires_codex_integration()
-
     run_configuration = nh.StepExecutorConfiguration(
         model="codex:gpt-5.4-mini",
         model_settings={
-            "working_directory": str(tmp_path.resolve()),
+            "working_directory": str(tmp_path),
         },
     )
 
@@ -64,89 +39,27 @@ def test_codex_natural_step_uses_custom_nh_tool(tmp_path: Path) -> None:
         assert test_function() == 42
 
 
-def test_codex_skill() -> None:
-    requires_codex_integration()
-
-    import logfire
-
-    logfire.configure(send_to_logfire="if-token-present", console=logfire.ConsoleOptions(verbose=True))
-    logfire.instrument_pydantic_ai()
-
-    from nighthawk.backends.codex import CodexModelSettings
-
-    working_directory = Path(__file__).absolute().parent / "agent_working_directory"
-
-    try:
-        (working_directory / "test.txt").unlink(missing_ok=True)
-
-        configuration = nh.StepExecutorConfiguration(
-            model="codex:default",
-            model_settings=CodexModelSettings(
-                working_directory=str(working_directory.resolve()),
-            ).model_dump(),
-        )
-
-        step_executor = nh.AgentStepExecutor.from_configuration(
-            configuration=configuration,
-        )
-        with nh.run(step_executor):
-
-            @nh.natural_function
-            def test_function():
-                """natural
-                ---
-                deny: [pass, raise]
-                ---
-                Execute the `hoge` skill.
-                Then, without changing the current working directory, return the result of the `bash -c pwd` command.
-                """
-
-            result = test_function()
-
-            assert result == str(working_directory)
-            assert (working_directory / "test.txt").is_file()
-    finally:
-        (working_directory / "test.txt").unlink(missing_ok=True)
-
-
-def test_codex_skill_calc() -> None:
-    requires_codex_integration()
-
-    import logfire
-
-    logfire.configure(send_to_logfire="if-token-present", console=logfire.ConsoleOptions(verbose=True))
-    logfire.instrument_pydantic_ai()
-
-    from nighthawk.backends.codex import CodexModelSettings
-
-    working_directory = Path(__file__).absolute().parent / "agent_working_directory"
-
+@pytest.fixture(scope="module")
+def skill_step_executor(agent_working_directory: Path) -> nh.AgentStepExecutor:
     configuration = nh.StepExecutorConfiguration(
         model="codex:default",
         model_settings=CodexModelSettings(
-            working_directory=str(working_directory.resolve()),
+            working_directory=str(agent_working_directory),
         ).model_dump(),
     )
 
-    step_executor = nh.AgentStepExecutor.from_configuration(
+    return nh.AgentStepExecutor.from_configuration(
         configuration=configuration,
     )
-    with nh.run(step_executor):
-
-        @nh.natural_function
-        def test_function():
-            def calc(a, b):
-                return a + b * 8
 
-            """natural
-            ---
-            deny: [pass, raise]
-            ---
-            Execute the `test` skill.
-            """
 
-            return result
+@requires_codex_integration
+def test_codex_skill(skill_step_executor: nh.AgentStepExecutor, agent_working_directory: Path) -> None:
+    with nh.run(skill_step_executor):
+        execute_hoge_skill(agent_working_directory, pwd_command="bash -c pwd")
 
-        result = test_function()
 
-        assert result == 1 + 2 * 8
+@requires_codex_integration
+def test_codex_skill_calc(skill_step_executor: nh.AgentStepExecutor) -> None:
+    with nh.run(skill_step_executor):
+        execute_test_skill()
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+import nighthawk as nh
+from tests.integration.skip_helpers import (
+    requires_claude_code_cli_integration,
+    requires_claude_code_sdk_integration,
+    requires_codex_integration,
+)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        pytest.param("claude-code-sdk:sonnet", id="claude-code-sdk", marks=requires_claude_code_sdk_integration),
+        pytest.param("claude-code-cli:haiku", id="claude-code-cli", marks=requires_claude_code_cli_integration),
+        pytest.param("codex:gpt-5.4-mini", id="codex", marks=requires_codex_integration),
+    ],
+)
+def test_natural_step_uses_tool(tmp_path: Path, model: str) -> None:
+    run_configuration = nh.StepExecutorConfiguration(
+        model=model,
+        model_settings={
+            "working_directory": str(tmp_path),
+        },
+    )
+
+    step_executor = nh.AgentStepExecutor.from_configuration(
+        configuration=run_configuration,
+    )
+
+    with nh.run(step_executor):
+
+        @nh.natural_function
+        def test_function() -> str:
+            result = ""
+            """natural
+            Set <:result> to "2".
+            """
+
+            return result
+
+        assert test_function() == "2"
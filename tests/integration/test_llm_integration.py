@@ -2,7 +2,6 @@ import os
 from pathlib import Path
 from typing import Literal
 
-import logfire
 import pytest
 from pydantic import BaseModel
 from pydantic_ai import RunContext
@@ -12,14 +11,10 @@ import nighthawk as nh
 from nighthawk.runtime.step_context import StepContext
 from tests.integration.skip_helpers import requires_openai_integration
 
-logfire.configure(send_to_logfire="if-token-present")
-logfire.instrument_pydantic_ai()
-
-
-def _requires_openai_multimodal_integration():  # type: ignore[no-untyped-def]
-    if os.getenv("NIGHTHAWK_OPENAI_MULTIMODAL_INTEGRATION_TESTS") != "1":
-        pytest.skip("OpenAI multimodal integration tests are disabled")
-    return requires_openai_integration()
+_requires_openai_multimodal_integration = pytest.mark.skipif(
+    os.getenv("NIGHTHAWK_OPENAI_MULTIMODAL_INTEGRATION_TESTS") != "1",
+    reason="OpenAI multimodal integration tests are disabled",
+)
 
 
 def _build_single_pixel_png(*, red: int, green: int, blue: int) -> bytes:
@@ -71,16 +66,10 @@ def classify_pixel_colors(
     return result
 
 
+@requires_openai_integration
 @pytest.mark.asyncio
-async def test_async_function_call():
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano", model_settings=openai_responses_model_settings_class(openai_reasoning_effort="high")
-        ),
-    )
-    with nh.run(step_executor):
+async def test_async_function_call(openai_nano_low_step_executor: nh.AgentStepExecutor):
+    with nh.run(openai_nano_low_step_executor):
 
         @nh.natural_function
         async def test_function():
@@ -97,16 +86,9 @@ async def test_async_function_call():
         assert (await test_function()) == 17
 
 
-def test_multiple_blocks_one_call_scope():
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano", model_settings=openai_responses_model_settings_class(openai_reasoning_effort="low")
-        ),
-    )
-
-    with nh.run(step_executor):
+@requires_openai_integration
+def test_multiple_blocks_one_call_scope(openai_nano_low_step_executor: nh.AgentStepExecutor):
+    with nh.run(openai_nano_low_step_executor):
 
         @nh.natural_function
         def f() -> int:
@@ -124,16 +106,9 @@ def test_multiple_blocks_one_call_scope():
         assert f() == 31
 
 
-def test_system_prompt_suffix_fragments():
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano", model_settings=openai_responses_model_settings_class(openai_reasoning_effort="low")
-        ),
-    )
-
-    with nh.run(step_executor), nh.scope(system_prompt_suffix_fragments=["Hello suffix"]):
+@requires_openai_integration
+def test_system_prompt_suffix_fragments(openai_nano_low_step_executor: nh.AgentStepExecutor):
+    with nh.run(openai_nano_low_step_executor), nh.scope(system_prompt_suffix_fragments=["Hello suffix"]):
 
         @nh.natural_function
         def f() -> int:
@@ -147,16 +122,9 @@ def test_system_prompt_suffix_fragments():
         assert f() == 11
 
 
-def test_user_prompt_suffix_fragments():
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano", model_settings=openai_responses_model_settings_class(openai_reasoning_effort="low")
-        ),
-    )
-
-    with nh.run(step_executor), nh.scope(user_prompt_suffix_fragments=["Hello suffix"]):
+@requires_openai_integration
+def test_user_prompt_suffix_fragments(openai_nano_low_step_executor: nh.AgentStepExecutor):
+    with nh.run(openai_nano_low_step_executor), nh.scope(user_prompt_suffix_fragments=["Hello suffix"]):
 
         @nh.natural_function
         def f() -> int:
@@ -170,16 +138,9 @@ def test_user_prompt_suffix_fragments():
         assert f() == 11
 
 
-def test_tool_visibility_scopes():
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano", model_settings=openai_responses_model_settings_class(openai_reasoning_effort="low")
-        ),
-    )
-
-    with nh.run(step_executor):
+@requires_openai_integration
+def test_tool_visibility_scopes(openai_nano_low_step_executor: nh.AgentStepExecutor):
+    with nh.run(openai_nano_low_step_executor):
 
         @nh.tool(name="hello")
         def hello(run_context: RunContext[StepContext]) -> str:  # type: ignore[no-untyped-def]
@@ -198,16 +159,9 @@ def test_tool_visibility_scopes():
             f()
 
 
-def test_provided_tools_smoke():
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano", model_settings=openai_responses_model_settings_class(openai_reasoning_effort="low")
-        ),
-    )
-
-    with nh.run(step_executor):
+@requires_openai_integration
+def test_provided_tools_smoke(openai_nano_low_step_executor: nh.AgentStepExecutor):
+    with nh.run(openai_nano_low_step_executor):
 
         @nh.tool(name="my_tool")
         def my_tool(run_context: RunContext[StepContext]) -> int:  # type: ignore[no-untyped-def]
@@ -224,16 +178,9 @@ def test_provided_tools_smoke():
         assert f() == 3
 
 
-def test_session_isolation(tmp_path):
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano", model_settings=openai_responses_model_settings_class(openai_reasoning_effort="low")
-        ),
-    )
-
-    with nh.run(step_executor):
+@requires_openai_integration
+def test_session_isolation(tmp_path, openai_nano_low_step_executor: nh.AgentStepExecutor):
+    with nh.run(openai_nano_low_step_executor):
 
         @nh.tool(name="tmp_write")
         def tmp_write(run_context: RunContext[StepContext]) -> str:  # type: ignore[no-untyped-def]
@@ -253,16 +200,9 @@ def test_session_isolation(tmp_path):
         assert "hello" in result
 
 
-def test_provided_tools_do_not_leak_into_outer_scope(tmp_path):
-    openai_responses_model_settings_class = requires_openai_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-nano", model_settings=openai_responses_model_settings_class(openai_reasoning_effort="low")
-        ),
-    )
-
-    with nh.run(step_executor):
+@requires_openai_integration
+def test_provided_tools_do_not_leak_into_outer_scope(tmp_path, openai_nano_low_step_executor: nh.AgentStepExecutor):
+    with nh.run(openai_nano_low_step_executor):
 
         @nh.tool(name="tmp_write")
         def tmp_write(run_context: RunContext[StepContext]) -> str:  # type: ignore[no-untyped-def]
@@ -285,16 +225,9 @@ def test_provided_tools_do_not_leak_into_outer_scope(tmp_path):
     assert isinstance(result, str)
 
 
-def test_provider_backed_executor_accepts_native_multimodal_user_prompt_content():
-    openai_responses_model_settings_class = _requires_openai_multimodal_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-mini",
-            model_settings=openai_responses_model_settings_class(openai_reasoning_effort="high"),
-        ),
-    )
-
+@requires_openai_integration
+@_requires_openai_multimodal_integration
+def test_provider_backed_executor_accepts_native_multimodal_user_prompt_content(openai_mini_high_step_executor: nh.AgentStepExecutor):
     first_image = BinaryContent(
         data=_build_single_pixel_png(red=255, green=0, blue=0),
         media_type="image/png",
@@ -311,7 +244,7 @@ def test_provider_backed_executor_accepts_native_multimodal_user_prompt_content(
         identifier="third_image",
     )
 
-    with nh.run(step_executor):
+    with nh.run(openai_mini_high_step_executor):
         result = classify_pixel_colors(
             first_image=first_image,
             second_image=second_image,
@@ -325,16 +258,9 @@ def test_provider_backed_executor_accepts_native_multimodal_user_prompt_content(
     )
 
 
-def test_provider_backed_executor_accepts_native_multimodal_tool_result_content():
-    openai_responses_model_settings_class = _requires_openai_multimodal_integration()
-
-    step_executor = nh.AgentStepExecutor.from_configuration(
-        configuration=nh.StepExecutorConfiguration(
-            model="openai-responses:gpt-5.4-mini",
-            model_settings=openai_responses_model_settings_class(openai_reasoning_effort="high"),
-        ),
-    )
-
+@requires_openai_integration
+@_requires_openai_multimodal_integration
+def test_provider_backed_executor_accepts_native_multimodal_tool_result_content(openai_mini_high_step_executor: nh.AgentStepExecutor):
     @nh.tool(name="load_pixel_color_gallery")
     def load_pixel_color_gallery(run_context: RunContext[StepContext]) -> list[object]:  # type: ignore[no-untyped-def]
         _ = run_context
@@ -375,7 +301,7 @@ def test_provider_backed_executor_accepts_native_multimodal_tool_result_content(
         """
         return result
 
-    with nh.run(step_executor):
+    with nh.run(openai_mini_high_step_executor):
         result = classify_tool_returned_pixel_colors()
 
     assert result == PixelColorClassification(
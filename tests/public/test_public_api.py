@@ -7,7 +7,6 @@ from opentelemetry.sdk.trace import Event, ReadableSpan, TracerProvider
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 from opentelemetry.trace import StatusCode
-from pydantic import BaseModel
 
 import nighthawk as nh
 from nighthawk.errors import NighthawkError
@@ -17,10 +16,6 @@ from nighthawk.runtime.step_executor import AgentStepExecutor
 from tests.execution.stub_executor import StubExecutor
 
 
-class FakeMemory(BaseModel):
-    n: int = 0
-
-
 @pytest.fixture
 def step_span_exporter() -> Generator[InMemorySpanExporter, None, None]:
     span_exporter = InMemorySpanExporter()
@@ -325,18 +320,18 @@ def test_run_configuration_model_default_applies():
     assert configuration.model == "openai-responses:gpt-5.4-nano"
 
 
-def test_run_configuration_model_requires_provider_model_format():
-    with pytest.raises(ValueError, match="provider:model"):
-        nh.StepExecutorConfiguration(model="openai-responses")
-
-    with pytest.raises(ValueError, match="provider:model"):
-        nh.StepExecutorConfiguration(model=":gpt-5.4-nano")
-
-    with pytest.raises(ValueError, match="provider:model"):
-        nh.StepExecutorConfiguration(model="openai-responses:")
-
+@pytest.mark.parametrize(
+    "model",
+    [
+        "openai-responses",
+        ":gpt-5.4-nano",
+        "openai-responses:",
+        "openai-responses:gpt-5.4-nano:extra",
+    ],
+)
+def test_run_configuration_model_requires_provider_model_format(model: str) -> None:
     with pytest.raises(ValueError, match="provider:model"):
-        nh.StepExecutorConfiguration(model="openai-responses:gpt-5.4-nano:extra")
+        nh.StepExecutorConfiguration(model=model)
 
 
 def test_agent_step_executor_constructor_supports_standard_path_with_agent() -> None:
@@ -3,7 +3,6 @@ from tests.execution.stub_executor import StubExecutor
 
 
 def test_readme_quick_example_style(tmp_path):
-    nh.StepExecutorConfiguration()
     with nh.run(StubExecutor()):
 
         @nh.natural_function
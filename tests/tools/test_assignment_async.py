@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+from typing import Annotated
 
 import pytest
 from pydantic import BaseModel
@@ -11,13 +12,19 @@ from nighthawk.tools.assignment import assign_tool, assign_tool_async, eval_expr
 from nighthawk.tools.contracts import ToolBoundaryError
 
 
-def _new_step_context() -> StepContext:
+def _new_step_context(
+    *,
+    step_id: str = "test_assignment_async",
+    step_locals: dict[str, object] | None = None,
+    binding_commit_targets: set[str] | None = None,
+    read_binding_names: frozenset[str] = frozenset(),
+) -> StepContext:
     return StepContext(
-        step_id="test_assignment_async",
+        step_id=step_id,
         step_globals={"__builtins__": __builtins__},
-        step_locals={},
-        binding_commit_targets=set(),
-        read_binding_names=frozenset(),
+        step_locals={} if step_locals is None else step_locals,
+        binding_commit_targets=set() if binding_commit_targets is None else binding_commit_targets,
+        read_binding_names=read_binding_names,
         implicit_reference_name_to_value={},
     )
 
@@ -58,14 +65,7 @@ def test_assign_tool_async_assigns_awaited_result() -> None:
 
 
 def test_assign_rejects_rebind_of_read_binding() -> None:
-    step_context = StepContext(
-        step_id="test_read_guard",
-        step_globals={"__builtins__": __builtins__},
-        step_locals={"data": {"key": "old"}},
-        binding_commit_targets=set(),
-        read_binding_names=frozenset({"data"}),
-        implicit_reference_name_to_value={},
-    )
+    step_context = _new_step_context(step_id="test_read_guard", step_locals={"data": {"key": "old"}}, read_binding_names=frozenset({"data"}))
 
     with pytest.raises(ToolBoundaryError):
         assign_tool(step_context, "data", "{'key': 'new'}")
@@ -74,14 +74,7 @@ def test_assign_rejects_rebind_of_read_binding() -> None:
 
 
 def test_assign_allows_rebind_when_both_read_and_write_binding() -> None:
-    step_context = StepContext(
-        step_id="test_read_write",
-        step_globals={"__builtins__": __builtins__},
-        step_locals={"data": {"key": "old"}},
-        binding_commit_targets={"data"},
-        read_binding_names=frozenset(),
-        implicit_reference_name_to_value={},
-    )
+    step_context = _new_step_context(step_id="test_read_write", step_locals={"data": {"key": "old"}}, binding_commit_targets={"data"})
 
     result = assign_tool(step_context, "data", "{'key': 'new'}")
 
@@ -91,14 +84,7 @@ def test_assign_allows_rebind_when_both_read_and_write_binding() -> None:
 
 
 def test_assign_allows_multiple_rebinds_of_new_local() -> None:
-    step_context = StepContext(
-        step_id="test_new_local",
-        step_globals={"__builtins__": __builtins__},
-        step_locals={},
-        binding_commit_targets=set(),
-        read_binding_names=frozenset(),
-        implicit_reference_name_to_value={},
-    )
+    step_context = _new_step_context(step_id="test_new_local")
 
     assign_tool(step_context, "temp", "1")
     assert step_context.step_locals["temp"] == 1
@@ -273,14 +259,7 @@ def test_assign_dotted_path_marks_write_binding_root_dirty() -> None:
     class Model(BaseModel):
         value: int = 0
 
-    step_context = StepContext(
-        step_id="test_write_root_dirty",
-        step_globals={"__builtins__": __builtins__},
-        step_locals={"model": Model()},
-        binding_commit_targets={"model"},
-        read_binding_names=frozenset(),
-        implicit_reference_name_to_value={},
-    )
+    step_context = _new_step_context(step_id="test_write_root_dirty", step_locals={"model": Model()}, binding_commit_targets={"model"})
 
     assign_tool(step_context, "model.value", "2")
 
@@ -292,15 +271,53 @@ def test_assign_dotted_path_read_binding_root_is_not_marked_dirty() -> None:
     class Model(BaseModel):
         value: int = 0
 
-    step_context = StepContext(
-        step_id="test_read_root_not_dirty",
-        step_globals={"__builtins__": __builtins__},
-        step_locals={"model": Model()},
-        binding_commit_targets=set(),
-        read_binding_names=frozenset({"model"}),
-        implicit_reference_name_to_value={},
-    )
+    step_context = _new_step_context(step_id="test_read_root_not_dirty", step_locals={"model": Model()}, read_binding_names=frozenset({"model"}))
 
     assign_tool(step_context, "model.value", "2")
 
     assert step_context.dirty_output_binding_names == set()
+
+
+@pytest.mark.parametrize("target_path", ["", "result.", ".result", "result..value", "1result", "résultat", "__result", "result.__dict__"])
+def test_assign_rejects_invalid_target_path(target_path: str) -> None:
+    step_context = _new_step_context(step_locals={"result": 0})
+
+    with pytest.raises(ToolBoundaryError) as exception_info:
+        assign_tool(step_context, target_path, "1")
+    assert exception_info.value.kind == "invalid_input"
+    assert step_context.step_locals == {"result": 0}
+
+
+def test_assign_validates_binding_type_with_unhashable_annotation_metadata() -> None:
+    step_context = _new_step_context()
+    step_context.binding_name_to_type["count"] = Annotated[int, {"unit": "items"}]
+
+    assign_tool(step_context, "count", "'3'")
+    assert step_context.step_locals["count"] == 3
+
+    with pytest.raises(ToolBoundaryError) as exception_info:
+        assign_tool(step_context, "count", "'three'")
+    assert exception_info.value.kind == "invalid_input"
+    assert step_context.step_locals["count"] == 3
+
+
+def test_assign_validates_reordered_union_bindings_independently() -> None:
+    first_step_context = _new_step_context()
+    first_step_context.binding_name_to_type["x"] = float | int
+    first_step_context.binding_name_to_type["values"] = list[float | int]
+    assign_tool(first_step_context, "x", "True")
+    assign_tool(first_step_context, "values", "[True]")
+
+    step_context = _new_step_context()
+    step_context.binding_name_to_type["x"] = int | float
+    step_context.binding_name_to_type["values"] = list[int | float]
+
+    assign_tool(step_context, "x", "True")
+    assign_tool(step_context, "values", "[True]")
+
+    assert step_context.step_locals["x"] == 1
+    assert type(step_context.step_locals["x"]) is int
+    values = step_context.step_locals["values"]
+    assert isinstance(values, list)
+    assert values == [1]
+    assert type(values[0]) is int
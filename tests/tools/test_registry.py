@@ -4,6 +4,18 @@ import pytest
 
 import nighthawk as nh
 from nighthawk.errors import ToolRegistrationError
+from nighthawk.runtime.step_contract import PassStepOutcome, StepFinalResult
+from nighthawk.tools.registry import _reset_all_tools_for_tests, get_visible_tools
+from tests.execution.prompt_test_helpers import FakeAgent, FakeRunResult
+
+
+@pytest.fixture(autouse=True)
+def _reset_tools() -> None:
+    _reset_all_tools_for_tests()
+
+
+def _visible_tool_name_set() -> set[str]:
+    return {tool.name for tool in get_visible_tools()}
 
 
 def test_tool_registers_globally_without_environment():
@@ -12,10 +24,7 @@ def test_tool_registers_globally_without_environment():
         return f"hello, {target}"
 
     # It should be visible even outside runtime context.
-    from nighthawk.tools.registry import get_visible_tools
-
-    names = [t.name for t in get_visible_tools()]
-    assert "test_global" in names
+    assert "test_global" in _visible_tool_name_set()
 
 
 def test_tool_name_conflict_requires_overwrite():
@@ -42,25 +51,9 @@ def test_tool_name_conflict_allows_overwrite_true():
 
 def test_tool_defined_in_call_scope_is_not_global(tmp_path):
     _ = tmp_path
-    nh.StepExecutorConfiguration()
-
-    class FakeRunResult:
-        def __init__(self, output):
-            self.output = output
-
-    class FakeAgent:
-        def run_sync(self, user_prompt, *, deps=None, **kwargs):  # type: ignore[no-untyped-def]
-            from nighthawk.runtime.step_contract import PassStepOutcome, StepFinalResult
-
-            _ = user_prompt
-            _ = deps
-            _ = kwargs
-            return FakeRunResult(StepFinalResult(result=PassStepOutcome(kind="pass")))
 
     agent = FakeAgent()
 
-    from nighthawk.tools.registry import get_visible_tools
-
     with nh.run(nh.AgentStepExecutor.from_agent(agent=agent)):
 
         @nh.natural_function
@@ -77,30 +70,21 @@ def test_tool_defined_in_call_scope_is_not_global(tmp_path):
         f()
 
     # After the decorated call returns, the call-scoped tool should not leak.
-    names = [t.name for t in get_visible_tools()]
-    assert "test_call_scoped" not in names
+    assert "test_call_scoped" not in _visible_tool_name_set()
 
 
 def test_call_scoped_tools_added_mid_call_are_visible_next_block(tmp_path):
-    nh.StepExecutorConfiguration()
-
-    class FakeRunResult:
-        def __init__(self, output):
-            self.output = output
-
     class FakeAgent:
         def __init__(self):
-            self.seen_tool_names: list[str] = []
+            self.seen_tool_name_set_list: list[frozenset[str]] = []
 
         def run_sync(self, user_prompt, *, deps=None, toolsets=None, **kwargs):  # type: ignore[no-untyped-def]
-            from nighthawk.runtime.step_contract import PassStepOutcome, StepFinalResult
-
             _ = user_prompt
             _ = deps
             _ = kwargs
             assert toolsets is not None
             toolset = toolsets[0]
-            self.seen_tool_names.append(",".join(sorted(toolset.tools.keys())))
+            self.seen_tool_name_set_list.append(frozenset(toolset.tools))
 
             return FakeRunResult(StepFinalResult(result=PassStepOutcome(kind="pass")))
 
@@ -125,18 +109,16 @@ def test_call_scoped_tools_added_mid_call_are_visible_next_block(tmp_path):
 
         f()
 
-    assert len(agent.seen_tool_names) == 2
-    assert "test_late_global" not in agent.seen_tool_names[0]
-    assert "test_late_global" in agent.seen_tool_names[1]
+    assert len(agent.seen_tool_name_set_list) == 2
+    assert "test_late_global" not in agent.seen_tool_name_set_list[0]
+    assert "test_late_global" in agent.seen_tool_name_set_list[1]
 
 
 def test_builtin_tools_are_always_visible():
-    from nighthawk.tools.registry import get_visible_tools
-
-    names = {t.name for t in get_visible_tools()}
+    visible_tool_name_set = _visible_tool_name_set()
 
-    assert "nh_eval" in names
-    assert "nh_assign" in names
+    assert "nh_eval" in visible_tool_name_set
+    assert "nh_assign" in visible_tool_name_set
 
 
 def test_builtin_tool_name_conflict_requires_overwrite():
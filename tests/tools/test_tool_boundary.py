@@ -47,7 +47,7 @@ from nighthawk.backends.base import _collect_request_prompt_part_list
 from nighthawk.backends.mcp_boundary import call_tool_for_claude_code_sdk, call_tool_for_low_level_mcp_server
 from nighthawk.backends.mcp_server import mcp_server_if_needed
 from nighthawk.backends.text_projection import project_request_prompt_part_list_to_text
-from nighthawk.backends.tool_bridge import build_tool_name_to_handler
+from nighthawk.backends.tool_bridge import ToolHandler, build_tool_name_to_handler
 from nighthawk.errors import NighthawkError
 from nighthawk.runtime.step_context import StepContext, ToolResultRenderingPolicy
 from nighthawk.tools.contracts import (
@@ -138,6 +138,20 @@ def _call_wrapped_tool_outcome(
     return anyio.run(run)
 
 
+async def _build_tool_handler(run_context: RunContext[StepContext], *, tool_name: str) -> ToolHandler:
+    visible_tools = get_visible_tools()
+    tool_name_to_tool = await FunctionToolset(visible_tools).get_tools(run_context)
+    tool_def = tool_name_to_tool[tool_name].tool_def
+    assert isinstance(tool_def, ToolDefinition)
+
+    with set_current_run_context(run_context):
+        tool_name_to_handler = await build_tool_name_to_handler(
+            model_request_parameters=ModelRequestParameters(function_tools=[tool_def]),
+            visible_tools=visible_tools,
+        )
+    return tool_name_to_handler[tool_name]
+
+
 def _test_tool_handler_result(
     *,
     payload: object | None,
@@ -323,11 +337,11 @@ def test_wrapper_preserves_list_binary_content_as_file() -> None:
         return ["caption", BinaryContent(data=_VALID_PNG_HEADER, media_type="image/png")]
 
     result = _call_wrapped_tool(name="test_mixed_return", function=test_mixed_return)
+    assert isinstance(result, list)
     tool_return_part = ToolReturnPart(tool_name="test_mixed_return", content=result)
     assert tool_return_part.files
     assert tool_return_part.files[0].media_type == "image/png"
-    dumped = tool_return_ta.dump_python(tool_return_part.content, mode="json")
-    assert dumped[0] == "caption"
+    assert result[0] == "caption"
 
 
 def test_wrapper_preserves_tuple_binary_content_as_file() -> None:
@@ -339,8 +353,7 @@ def test_wrapper_preserves_tuple_binary_content_as_file() -> None:
     tool_return_part = ToolReturnPart(tool_name="test_tuple_return", content=result)
     assert tool_return_part.files
     assert tool_return_part.files[0].media_type == "image/png"
-    dumped = tool_return_ta.dump_python(tool_return_part.content, mode="json")
-    assert dumped[0] == "caption"
+    assert result[0] == "caption"
 
 
 def test_wrapper_preserves_top_level_audio_url_as_file() -> None:
@@ -840,28 +853,8 @@ def test_backend_handler_wraps_recoverable_tool_boundary_error() -> None:
         usage=RunUsage(),
     )
 
-    visible_tools = get_visible_tools()
-    base_toolset = FunctionToolset(visible_tools)
-
-    async def get_tool_def():  # type: ignore[no-untyped-def]
-        tool_name_to_tool = await base_toolset.get_tools(run_context)
-        return tool_name_to_tool["test_boundary_error"].tool_def
-
-    tool_def = anyio.run(get_tool_def)
-    assert isinstance(tool_def, ToolDefinition)
-    model_request_parameters = ModelRequestParameters(function_tools=[tool_def])
-
-    async def build_handlers():  # type: ignore[no-untyped-def]
-        with set_current_run_context(run_context):
-            return await build_tool_name_to_handler(
-                model_request_parameters=model_request_parameters,
-                visible_tools=visible_tools,
-            )
-
-    handlers = anyio.run(build_handlers)
-    handler = handlers["test_boundary_error"]
-
     async def call_handler() -> ToolHandlerResult:
+        handler = await _build_tool_handler(run_context, tool_name="test_boundary_error")
         with set_current_run_context(run_context):
             return await handler({})
 
@@ -890,29 +883,8 @@ def test_backend_handler_invalid_args_returns_retry_prompt_text() -> None:
         usage=RunUsage(),
     )
 
-    visible_tools = get_visible_tools()
-
-    base_toolset = FunctionToolset(visible_tools)
-
-    async def get_tool_def():  # type: ignore[no-untyped-def]
-        tool_name_to_tool = await base_toolset.get_tools(run_context)
-        return tool_name_to_tool["test_arg"].tool_def
-
-    tool_def = anyio.run(get_tool_def)
-    assert isinstance(tool_def, ToolDefinition)
-    model_request_parameters = ModelRequestParameters(function_tools=[tool_def])
-
-    async def build_handlers():  # type: ignore[no-untyped-def]
-        with set_current_run_context(run_context):
-            return await build_tool_name_to_handler(
-                model_request_parameters=model_request_parameters,
-                visible_tools=visible_tools,
-            )
-
-    handlers = anyio.run(build_handlers)
-    handler = handlers["test_arg"]
-
     async def call_invalid() -> ToolHandlerResult:
+        handler = await _build_tool_handler(run_context, tool_name="test_arg")
         with set_current_run_context(run_context):
             return await handler({"x": "not an int"})
 
@@ -993,28 +965,8 @@ def test_backend_handler_calls_oversight_once_for_accept_decision(
         instrumentation_version=1,
     )
 
-    visible_tools = get_visible_tools()
-    base_toolset = FunctionToolset(visible_tools)
-
-    async def get_tool_def():  # type: ignore[no-untyped-def]
-        tool_name_to_tool = await base_toolset.get_tools(run_context)
-        return tool_name_to_tool["test_once_tool"].tool_def
-
-    tool_def = anyio.run(get_tool_def)
-    assert isinstance(tool_def, ToolDefinition)
-    model_request_parameters = ModelRequestParameters(function_tools=[tool_def])
-
-    async def build_handlers():  # type: ignore[no-untyped-def]
-        with set_current_run_context(run_context):
-            return await build_tool_name_to_handler(
-                model_request_parameters=model_request_parameters,
-                visible_tools=visible_tools,
-            )
-
-    handlers = anyio.run(build_handlers)
-    handler = handlers["test_once_tool"]
-
     async def call_handler() -> ToolHandlerResult:
+        handler = await _build_tool_handler(run_context, tool_name="test_once_tool")
         with (
             nh.run(StubExecutor()),
             nh.scope(oversight=nh.oversight.Oversight(inspect_tool_call=accept_tool_call)),
@@ -1075,28 +1027,8 @@ def test_backend_handler_raises_nighthawk_error_for_invalid_tool_oversight_decis
         usage=RunUsage(),
     )
 
-    visible_tools = get_visible_tools()
-    base_toolset = FunctionToolset(visible_tools)
-
-    async def get_tool_def():  # type: ignore[no-untyped-def]
-        tool_name_to_tool = await base_toolset.get_tools(run_context)
-        return tool_name_to_tool["test_invalid_tool_decision"].tool_def
-
-    tool_def = anyio.run(get_tool_def)
-    assert isinstance(tool_def, ToolDefinition)
-    model_request_parameters = ModelRequestParameters(function_tools=[tool_def])
-
-    async def build_handlers():  # type: ignore[no-untyped-def]
-        with set_current_run_context(run_context):
-            return await build_tool_name_to_handler(
-                model_request_parameters=model_request_parameters,
-                visible_tools=visible_tools,
-            )
-
-    handlers = anyio.run(build_handlers)
-    handler = handlers["test_invalid_tool_decision"]
-
     async def call_handler() -> ToolHandlerResult:
+        handler = await _build_tool_handler(run_context, tool_name="test_invalid_tool_decision")
         with (
             nh.run(StubExecutor()),
             nh.scope(oversight=nh.oversight.Oversight(inspect_tool_call=invalid_tool_decision)),
@@ -1134,28 +1066,8 @@ def test_backend_handler_preserves_oversight_rejection_and_records_tool_span_eve
         instrumentation_version=1,
     )
 
-    visible_tools = get_visible_tools()
-    base_toolset = FunctionToolset(visible_tools)
-
-    async def get_tool_def():  # type: ignore[no-untyped-def]
-        tool_name_to_tool = await base_toolset.get_tools(run_context)
-        return tool_name_to_tool["test_governed_tool"].tool_def
-
-    tool_def = anyio.run(get_tool_def)
-    assert isinstance(tool_def, ToolDefinition)
-    model_request_parameters = ModelRequestParameters(function_tools=[tool_def])
-
-    async def build_handlers():  # type: ignore[no-untyped-def]
-        with set_current_run_context(run_context):
-            return await build_tool_name_to_handler(
-                model_request_parameters=model_request_parameters,
-                visible_tools=visible_tools,
-            )
-
-    handlers = anyio.run(build_handlers)
-    handler = handlers["test_governed_tool"]
-
     async def call_handler() -> ToolHandlerResult:
+        handler = await _build_tool_handler(run_context, tool_name="test_governed_tool")
         with (
             nh.run(StubExecutor()),
             nh.scope(oversight=nh.oversight.Oversight(inspect_tool_call=reject_tool_call)),
@@ -1200,11 +1112,9 @@ def test_mcp_boundary_low_level_mcp_server_returns_text_content_and_propagates_o
         )
 
     content = anyio.run(call_boundary)
-    assert isinstance(content, list)
     assert len(content) == 1
-    item: Any = content[0]
-    assert item.type == "text"
-    assert item.text == "2"
+    assert isinstance(content[0], TextContent)
+    assert content[0].text == "2"
 
 
 def test_mcp_boundary_claude_code_returns_text_content() -> None: